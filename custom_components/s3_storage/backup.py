@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from collections.abc import AsyncIterator, Callable, Coroutine
-from functools import wraps
-import json
+from functools import partial, wraps
+import hashlib
+from itertools import islice
 import logging
+import time
 from typing import Any, Concatenate
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 
 from homeassistant.components.backup import (
@@ -19,26 +24,53 @@ from homeassistant.components.backup import (
     suggested_filename,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads_object
 
 from .const import (
     CONF_ACCESS_KEY_ID,
     CONF_BUCKET_NAME,
     CONF_ENDPOINT_URL,
+    CONF_PREFIX,
     CONF_SECRET_ACCESS_KEY,
     DATA_BACKUP_AGENT_LISTENERS,
+    DATA_S3_CLIENTS,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 METADATA_VERSION = "1"
+METADATA_FILENAME = "metadata.json"
+MULTIPART_PART_SIZE = 16 * 1024 * 1024
+MAX_CONCURRENCY = 4
+DOWNLOAD_RANGE_SIZE = MULTIPART_PART_SIZE
+INDEX_CACHE_TTL = 30
+MAX_METADATA_CONCURRENCY = 32
+MAX_POOL_CONNECTIONS = 64
+# Seconds an idle pooled connection is kept open for reuse
+CONNECTION_KEEPALIVE_TIMEOUT = 60
 
 
 async def async_get_backup_agents(
     hass: HomeAssistant,
 ) -> list[BackupAgent]:
     """Return a list of backup agents."""
-    entries = hass.config_entries.async_loaded_entries(DOMAIN)
-    return [S3StorageBackupAgent(hass, entry) for entry in entries]
+    clients = hass.data.setdefault(DATA_S3_CLIENTS, {})
+    agents: list[BackupAgent] = []
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        if (client := clients.get(entry.entry_id)) is None:
+            client = clients[entry.entry_id] = SharedS3Client(entry)
+            entry.async_on_unload(partial(_async_close_client, hass, entry.entry_id))
+        agents.append(S3StorageBackupAgent(hass, entry, client))
+    return agents
+
+
+async def _async_close_client(hass: HomeAssistant, entry_id: str) -> None:
+    """Close the S3 client of an unloaded config entry."""
+    clients = hass.data[DATA_S3_CLIENTS]
+    await clients.pop(entry_id).async_close()
+    if not clients:
+        hass.data.pop(DATA_S3_CLIENTS)
 
 
 @callback
@@ -61,6 +93,31 @@ def async_register_backup_agents_listener(
     return remove_listener
 
 
+def _shard(backup_id: str) -> str:
+    """Return the shard prefix of a backup id."""
+    return hashlib.blake2b(backup_id.encode(), digest_size=1).hexdigest()
+
+
+def _parse_backup(key: str, payload: bytes | str) -> AgentBackup | None:
+    """Parse the metadata JSON of a backup, or return None if it is invalid."""
+    try:
+        return AgentBackup.from_dict(json_loads_object(payload))
+    except (KeyError, TypeError, ValueError):
+        _LOGGER.warning("Ignoring %s: invalid backup metadata", key)
+        return None
+
+
+def _parse_backups(
+    payloads: list[tuple[str, bytes | str]],
+) -> dict[str, AgentBackup]:
+    """Parse backup metadata JSON payloads, keyed by backup object key."""
+    return {
+        key: backup
+        for key, payload in payloads
+        if (backup := _parse_backup(key, payload)) is not None
+    }
+
+
 def handle_backup_errors[_R, **P](
     func: Callable[Concatenate[S3StorageBackupAgent, P], Coroutine[Any, Any, _R]],
 ) -> Callable[Concatenate[S3StorageBackupAgent, P], Coroutine[Any, Any, _R]]:
@@ -73,43 +130,108 @@ def handle_backup_errors[_R, **P](
         try:
             return await func(self, *args, **kwargs)
         except ClientError as err:
-            error_code = err.response.get("Error", {}).get("Code", "")
-            _LOGGER.debug(
-                "Error during backup in %s: Code %s, message %s",
-                func.__name__,
-                error_code,
-                str(err),
-                exc_info=True,
-            )
-            raise BackupAgentError(
-                f"Error during backup operation in {func.__name__}:"
-                f" Code {error_code}, message: {str(err)}"
-            ) from err
+            raise _backup_agent_error(func.__name__, err) from err
 
     return wrapper
 
 
+def _is_not_found(err: ClientError) -> bool:
+    """Return whether an S3 client error reports a missing object."""
+    return err.response.get("Error", {}).get("Code") in ("404", "NoSuchKey")
+
+
+def _backup_agent_error(operation: str, err: ClientError) -> BackupAgentError:
+    """Log an S3 client error and convert it to a backup agent error."""
+    error_code = err.response.get("Error", {}).get("Code", "")
+    _LOGGER.debug(
+        "Error during backup in %s: Code %s, message %s",
+        operation,
+        error_code,
+        str(err),
+        exc_info=True,
+    )
+    return BackupAgentError(
+        f"Error during backup operation in {operation}:"
+        f" Code {error_code}, message: {str(err)}"
+    )
+
+
+class SharedS3Client:
+    """S3 client shared by the backup agents of a config entry."""
+
+    def __init__(self, entry) -> None:
+        """Initialize the shared S3 client."""
+        self._endpoint_url = entry.data.get(CONF_ENDPOINT_URL)
+        self._access_key_id = entry.data[CONF_ACCESS_KEY_ID]
+        self._secret_access_key = entry.data[CONF_SECRET_ACCESS_KEY]
+        self._session = aioboto3.Session()
+        self._client_cm = None
+        self._client = None
+        self._closed = False
+        self._lock = asyncio.Lock()
+
+    async def async_get(self):
+        """Get the S3 client, creating it on first use."""
+        async with self._lock:
+            if self._closed:
+                raise BackupAgentError("S3 client is closed")
+            if self._client is None:
+                self._client_cm = self._session.client(
+                    "s3",
+                    endpoint_url=self._endpoint_url,
+                    aws_access_key_id=self._access_key_id,
+                    aws_secret_access_key=self._secret_access_key,
+                    config=AioConfig(
+                        # Adaptive retries back off with client-side rate
+                        # limiting when S3 answers 503 SlowDown
+                        retries={"mode": "adaptive", "max_attempts": 10},
+                        connect_timeout=5,
+                        read_timeout=60,
+                        max_pool_connections=MAX_POOL_CONNECTIONS,
+                        connector_args={
+                            "keepalive_timeout": CONNECTION_KEEPALIVE_TIMEOUT
+                        },
+                    ),
+                )
+                self._client = await self._client_cm.__aenter__()
+            return self._client
+
+    async def async_close(self) -> None:
+        """Close the S3 client."""
+        async with self._lock:
+            self._closed = True
+            if self._client_cm is not None:
+                await self._client_cm.__aexit__(None, None, None)
+            self._client_cm = None
+            self._client = None
+
+
 class S3StorageBackupAgent(BackupAgent):
     """S3-compatible storage backup agent."""
 
     domain = DOMAIN
 
-    def __init__(self, hass: HomeAssistant, entry) -> None:
+    def __init__(self, hass: HomeAssistant, entry, client: SharedS3Client) -> None:
         """Initialize the S3 storage backup agent."""
         super().__init__()
+        self._hass = hass
         self._entry = entry
         self.name = entry.title
         self.unique_id = entry.entry_id
-        self._session = aioboto3.Session()
+        # Entries created before the prefix was configurable store backups
+        # at the root of the bucket
+        self._prefix = entry.data.get(CONF_PREFIX, "")
+        self._bucket = entry.data[CONF_BUCKET_NAME]
+        self._client = client
+        # backup_id -> (object key, backup, expiry on the monotonic clock)
+        self._index_cache: dict[str, tuple[str, AgentBackup, float]] = {}
+        # backup_id -> lookup in progress, shared by concurrent callers
+        self._lookups: dict[str, asyncio.Task[tuple[str, AgentBackup] | None]] = {}
+        self._metadata_semaphore = asyncio.Semaphore(MAX_METADATA_CONCURRENCY)
 
     async def _get_client(self):
-        """Get S3 client."""
-        return await self._session.client(
-            "s3",
-            endpoint_url=self._entry.data.get(CONF_ENDPOINT_URL),
-            aws_access_key_id=self._entry.data[CONF_ACCESS_KEY_ID],
-            aws_secret_access_key=self._entry.data[CONF_SECRET_ACCESS_KEY],
-        ).__aenter__()
+        """Get the S3 client shared by the agents of the config entry."""
+        return await self._client.async_get()
 
     @handle_backup_errors
     async def async_download_backup(
@@ -118,21 +240,71 @@ class S3StorageBackupAgent(BackupAgent):
         **kwargs: Any,
     ) -> AsyncIterator[bytes]:
         """Download a backup file."""
-        key = await self._find_object_by_backup_id(backup_id)
-        if key is None:
+        found = await self._find_object_by_backup_id(backup_id)
+        if found is None:
             raise BackupNotFound(f"Backup {backup_id} not found")
+        key, _ = found
 
         client = await self._get_client()
         try:
-            response = await client.get_object(
-                Bucket=self._entry.data[CONF_BUCKET_NAME],
+            response = await client.head_object(
+                Bucket=self._bucket,
                 Key=key
             )
+        except ClientError as err:
+            if not _is_not_found(err):
+                raise
+            # The key may come from the index cache and be deleted since
+            self._index_cache.pop(backup_id, None)
+            raise BackupNotFound(f"Backup {backup_id} not found") from err
+        return self._download_object(client, key, response["ContentLength"])
+
+    async def _download_object(
+        self,
+        client,
+        key: str,
+        size: int,
+        range_size: int = DOWNLOAD_RANGE_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> AsyncIterator[bytes]:
+        """Stream an object, fetching large objects as parallel byte ranges."""
+
+        async def fetch_range(start: int) -> bytes:
+            end = min(start + range_size, size) - 1
+            response = await client.get_object(
+                Bucket=self._bucket,
+                Key=key,
+                Range=f"bytes={start}-{end}",
+            )
             async with response["Body"] as stream:
-                while chunk := await stream.read(8192):
-                    yield chunk
-        finally:
-            await client.__aexit__(None, None, None)
+                return await stream.read()
+
+        try:
+            if size < range_size:
+                response = await client.get_object(Bucket=self._bucket, Key=key)
+                async with response["Body"] as stream:
+                    while chunk := await stream.read(8192):
+                        yield chunk
+                return
+
+            offsets = iter(range(0, size, range_size))
+            pending: deque[asyncio.Task[bytes]] = deque(
+                asyncio.create_task(fetch_range(start))
+                for start in islice(offsets, max_concurrency)
+            )
+            try:
+                while pending:
+                    data = await pending.popleft()
+                    if (start := next(offsets, None)) is not None:
+                        pending.append(asyncio.create_task(fetch_range(start)))
+                    yield data
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        except ClientError as err:
+            # handle_backup_errors only covers creating this iterator
+            raise _backup_agent_error("async_download_backup", err) from err
 
     @handle_backup_errors
     async def async_upload_backup(
@@ -146,24 +318,140 @@ class S3StorageBackupAgent(BackupAgent):
         metadata = {
             "metadata_version": METADATA_VERSION,
             "backup_id": backup.backup_id,
-            "backup_metadata": json.dumps(backup.as_dict()),
         }
 
         filename = suggested_filename(backup)
+        key = f"{self._backup_prefix(backup.backup_id)}{filename}"
         client = await self._get_client()
+        await self._upload_object(client, key, metadata, open_stream)
+        # The metadata object is written last and marks the backup complete
         try:
-            data = b""
-            async for chunk in await open_stream():
-                data += chunk
-
             await client.put_object(
-                Bucket=self._entry.data[CONF_BUCKET_NAME],
-                Key=filename,
-                Body=data,
+                Bucket=self._bucket,
+                Key=self._metadata_key(backup.backup_id),
+                Body=json_bytes(backup.as_dict()),
+                ContentType="application/json",
+                Metadata={**metadata, "filename": filename},
+            )
+        except BaseException:
+            # Without its metadata object the backup is never listed, so it
+            # could not be deleted through the agent later on
+            try:
+                await asyncio.shield(
+                    client.delete_object(Bucket=self._bucket, Key=key)
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.warning("Failed to remove %s", key, exc_info=True)
+            raise
+        self._cache_backup(key, backup)
+
+    async def _upload_object(
+        self,
+        client,
+        key: str,
+        metadata: dict[str, str],
+        open_stream: Callable[[], Coroutine[Any, Any, AsyncIterator[bytes]]],
+        part_size: int = MULTIPART_PART_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> None:
+        """Stream a backup to S3, as a multipart upload if it exceeds one part."""
+        stream = await open_stream()
+        buffer = bytearray()
+        async for chunk in stream:
+            buffer.extend(chunk)
+            if len(buffer) >= part_size:
+                break
+        else:
+            await client.put_object(
+                Bucket=self._bucket,
+                Key=key,
+                Body=bytes(buffer),
+                ContentType="application/x-tar",
                 Metadata=metadata,
             )
-        finally:
-            await client.__aexit__(None, None, None)
+            return
+
+        upload = await client.create_multipart_upload(
+            Bucket=self._bucket,
+            Key=key,
+            ContentType="application/x-tar",
+            Metadata=metadata,
+        )
+        upload_id = upload["UploadId"]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: list[asyncio.Task[dict[str, Any]]] = []
+
+        async def upload_part(part_number: int, body: bytes) -> dict[str, Any]:
+            try:
+                response = await client.upload_part(
+                    Bucket=self._bucket,
+                    Key=key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=body,
+                )
+            finally:
+                semaphore.release()
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        async def schedule_part(size: int) -> None:
+            # Wait for a slot before copying the part out of the buffer, so at
+            # most max_concurrency parts are held in memory besides the buffer
+            await semaphore.acquire()
+            # Stop reading the stream as soon as an earlier part has failed
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception():
+                    semaphore.release()
+                    raise task.exception()
+            with memoryview(buffer) as view, view[:size] as part:
+                body = bytes(part)
+            del buffer[:size]
+            tasks.append(asyncio.create_task(upload_part(len(tasks) + 1, body)))
+
+        try:
+            while len(buffer) >= part_size:
+                await schedule_part(part_size)
+            async for chunk in stream:
+                buffer.extend(chunk)
+                while len(buffer) >= part_size:
+                    await schedule_part(part_size)
+
+            # The last part may be shorter than part_size
+            if buffer:
+                await schedule_part(len(buffer))
+
+            parts = await asyncio.gather(*tasks)
+            parts.sort(key=lambda part: part["PartNumber"])
+            await client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            # Also runs when the backup is cancelled, as S3 keeps billing for
+            # the parts of an upload that is never completed or aborted
+            _LOGGER.debug("Aborting multipart upload of %s", key)
+
+            async def abort() -> None:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                try:
+                    await client.abort_multipart_upload(
+                        Bucket=self._bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    # Keep the original error; the upload is left for a
+                    # bucket lifecycle rule to clean up
+                    _LOGGER.warning(
+                        "Failed to abort multipart upload of %s", key, exc_info=True
+                    )
+
+            await asyncio.shield(abort())
+            raise
 
     @handle_backup_errors
     async def async_delete_backup(
@@ -172,41 +460,87 @@ class S3StorageBackupAgent(BackupAgent):
         **kwargs: Any,
     ) -> None:
         """Delete a backup file."""
-        key = await self._find_object_by_backup_id(backup_id)
-        if key is None:
+        found = await self._find_object_by_backup_id(backup_id)
+        if found is None:
             raise BackupNotFound(f"Backup {backup_id} not found")
+        key, _ = found
 
         client = await self._get_client()
-        try:
+        if key.startswith(self._backup_prefix(backup_id)):
+            # Drop the metadata first so a partially deleted backup is no
+            # longer listed
             await client.delete_object(
-                Bucket=self._entry.data[CONF_BUCKET_NAME],
-                Key=key
+                Bucket=self._bucket,
+                Key=self._metadata_key(backup_id),
             )
-        finally:
-            await client.__aexit__(None, None, None)
+        await client.delete_object(
+            Bucket=self._bucket,
+            Key=key
+        )
+        self._index_cache.pop(backup_id, None)
 
     @handle_backup_errors
     async def async_list_backups(self, **kwargs: Any) -> list[AgentBackup]:
         """List backups."""
-        backups: list[AgentBackup] = []
+        # backup id -> (backup object key, metadata object key)
+        objects: dict[str, tuple[str | None, str | None]] = {}
+        legacy_keys: list[str] = []
         client = await self._get_client()
-        try:
-            paginator = client.get_paginator("list_objects_v2")
-            async for page in paginator.paginate(Bucket=self._entry.data[CONF_BUCKET_NAME]):
-                for obj in page.get("Contents", []):
-                    response = await client.head_object(
-                        Bucket=self._entry.data[CONF_BUCKET_NAME],
-                        Key=obj["Key"]
-                    )
-                    metadata = response.get("Metadata", {})
-                    if metadata.get("metadata_version") == METADATA_VERSION:
-                        backups.append(
-                            AgentBackup.from_dict(json.loads(metadata["backup_metadata"]))
-                        )
-        finally:
-            await client.__aexit__(None, None, None)
-
-        return backups
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=self._bucket,
+            Prefix=self._prefix,
+            PaginationConfig={"PageSize": 1000},
+        ):
+            for obj in page.get("Contents", []):
+                parts = obj["Key"].removeprefix(self._prefix).split("/")
+                if len(parts) == 1:
+                    legacy_keys.append(obj["Key"])
+                    continue
+                # Skip anything not laid out as {shard}/{backup_id}/{name}
+                if len(parts) != 3 or parts[0] != _shard(parts[1]):
+                    continue
+                backup_id, name = parts[1], parts[2]
+                backup_key, metadata_key = objects.get(backup_id, (None, None))
+                if name == METADATA_FILENAME:
+                    metadata_key = obj["Key"]
+                else:
+                    backup_key = obj["Key"]
+                objects[backup_id] = (backup_key, metadata_key)
+
+        found = [
+            (backup_key, metadata_key)
+            for backup_key, metadata_key in objects.values()
+            if backup_key is not None and metadata_key is not None
+        ]
+        async def read_metadata(key: str) -> tuple[str, bytes] | None:
+            try:
+                return await self._read_metadata(client, key)
+            except ClientError as err:
+                # Deleted since it was listed
+                if not _is_not_found(err):
+                    raise
+                return None
+
+        payloads: list[tuple[str, bytes | str]] = []
+        metadata = await asyncio.gather(*(read_metadata(key) for _, key in found))
+        for (key, _), result in zip(found, metadata, strict=True):
+            if result is not None:
+                payloads.append((key, result[1]))
+        legacy_payloads = await asyncio.gather(
+            *(self._read_legacy_metadata(client, key) for key in legacy_keys)
+        )
+        for key, payload in zip(legacy_keys, legacy_payloads, strict=True):
+            if payload is not None:
+                payloads.append((key, payload))
+
+        # Parse all metadata in one executor job to keep it off the event loop
+        index = await self._hass.async_add_executor_job(_parse_backups, payloads)
+
+        self._index_cache.clear()
+        for key, backup in index.items():
+            self._cache_backup(key, backup)
+        return list(index.values())
 
     @handle_backup_errors
     async def async_get_backup(
@@ -215,38 +549,123 @@ class S3StorageBackupAgent(BackupAgent):
         **kwargs: Any,
     ) -> AgentBackup:
         """Return a backup."""
-        key = await self._find_object_by_backup_id(backup_id)
-        if key is None:
+        found = await self._find_object_by_backup_id(backup_id)
+        if found is None:
             raise BackupNotFound(f"Backup {backup_id} not found")
+        return found[1]
 
-        client = await self._get_client()
-        try:
+    def _backup_prefix(self, backup_id: str) -> str:
+        """Return the key prefix holding the objects of a backup."""
+        return f"{self._prefix}{_shard(backup_id)}/{backup_id}/"
+
+    def _metadata_key(self, backup_id: str) -> str:
+        """Return the key of the metadata object of a backup."""
+        return f"{self._backup_prefix(backup_id)}{METADATA_FILENAME}"
+
+    async def _read_metadata(self, client, key: str) -> tuple[str, bytes] | None:
+        """Read the backup file name and metadata JSON of a metadata object."""
+        async with self._metadata_semaphore:
+            response = await client.get_object(
+                Bucket=self._bucket,
+                Key=key
+            )
+            async with response["Body"] as stream:
+                payload = await stream.read()
+        metadata = response.get("Metadata", {})
+        if (
+            metadata.get("metadata_version") != METADATA_VERSION
+            or "filename" not in metadata
+        ):
+            return None
+        return metadata["filename"], payload
+
+    async def _read_legacy_metadata(self, client, key: str) -> str | None:
+        """Read the metadata JSON stored on a backup in the legacy flat layout."""
+        async with self._metadata_semaphore:
             response = await client.head_object(
-                Bucket=self._entry.data[CONF_BUCKET_NAME],
+                Bucket=self._bucket,
                 Key=key
             )
-            metadata = response.get("Metadata", {})
-            return AgentBackup.from_dict(json.loads(metadata["backup_metadata"]))
-        finally:
-            await client.__aexit__(None, None, None)
-
-    async def _find_object_by_backup_id(self, backup_id: str) -> str | None:
-        """Find an object by backup id."""
+        metadata = response.get("Metadata", {})
+        if metadata.get("metadata_version") != METADATA_VERSION:
+            return None
+        return metadata.get("backup_metadata")
+
+    def _cache_backup(self, key: str, backup: AgentBackup) -> None:
+        """Add a backup to the index cache."""
+        self._index_cache[backup.backup_id] = (
+            key,
+            backup,
+            time.monotonic() + INDEX_CACHE_TTL,
+        )
+
+    async def _find_object_by_backup_id(
+        self, backup_id: str
+    ) -> tuple[str, AgentBackup] | None:
+        """Find the object key and metadata of a backup by backup id."""
+        if (cached := self._index_cache.get(backup_id)) is not None:
+            key, backup, expires = cached
+            if expires > time.monotonic():
+                return key, backup
+            del self._index_cache[backup_id]
+
+        if (task := self._lookups.get(backup_id)) is None:
+            task = asyncio.create_task(self._lookup_backup(backup_id))
+            self._lookups[backup_id] = task
+            task.add_done_callback(lambda _: self._lookups.pop(backup_id, None))
+        # Shielded so a cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(task)
+
+    async def _lookup_backup(
+        self, backup_id: str
+    ) -> tuple[str, AgentBackup] | None:
+        """Look up the object key and metadata of a backup in the bucket."""
         client = await self._get_client()
+        metadata_key = self._metadata_key(backup_id)
         try:
-            paginator = client.get_paginator("list_objects_v2")
-            async for page in paginator.paginate(Bucket=self._entry.data[CONF_BUCKET_NAME]):
-                for obj in page.get("Contents", []):
-                    response = await client.head_object(
-                        Bucket=self._entry.data[CONF_BUCKET_NAME],
-                        Key=obj["Key"]
+            result = await self._read_metadata(client, metadata_key)
+        except ClientError as err:
+            if not _is_not_found(err):
+                raise
+        else:
+            if result is not None and (
+                backup := _parse_backup(metadata_key, result[1])
+            ) is not None:
+                key = f"{self._backup_prefix(backup_id)}{result[0]}"
+                self._cache_backup(key, backup)
+                return key, backup
+
+        async def read_legacy_metadata(key: str) -> tuple[str, AgentBackup | None]:
+            if (payload := await self._read_legacy_metadata(client, key)) is None:
+                return key, None
+            return key, _parse_backup(key, payload)
+
+        # Fall back to backups stored in the legacy flat layout, checking
+        # each page concurrently and stopping at the first match
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=self._bucket,
+            Prefix=self._prefix,
+            PaginationConfig={"PageSize": 1000},
+        ):
+            pending = {
+                asyncio.create_task(read_legacy_metadata(obj["Key"]))
+                for obj in page.get("Contents", [])
+                if "/" not in obj["Key"].removeprefix(self._prefix)
+            }
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
                     )
-                    metadata = response.get("Metadata", {})
-                    if (
-                        metadata.get("metadata_version") == METADATA_VERSION
-                        and backup_id == metadata.get("backup_id")
-                    ):
-                        return obj["Key"]
-        finally:
-            await client.__aexit__(None, None, None)
-        return None
\ No newline at end of file
+                    for task in done:
+                        key, backup = task.result()
+                        if backup is None:
+                            continue
+                        self._cache_backup(key, backup)
+                        if backup.backup_id == backup_id:
+                            return key, backup
+            finally:
+                for task in pending:
+                    task.cancel()
+        return None
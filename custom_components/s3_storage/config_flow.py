@@ -4,7 +4,7 @@ from collections.abc import Mapping
 import logging
 from typing import Any
 
-import boto3
+import aioboto3
 from botocore.exceptions import ClientError, ParamValidationError
 import voluptuous as vol
 
@@ -16,11 +16,37 @@ from .const import (
     CONF_ACCESS_KEY_ID,
     CONF_SECRET_ACCESS_KEY,
     CONF_ENDPOINT_URL,
+    CONF_PREFIX,
+    DEFAULT_PREFIX,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ACCESS_KEY_ID): str,
+        vol.Required(CONF_SECRET_ACCESS_KEY): str,
+        vol.Required(CONF_BUCKET_NAME, default="home-assistant-backups"): str,
+        vol.Optional(CONF_ENDPOINT_URL): str,
+        vol.Optional(CONF_REGION): str,
+        vol.Optional(CONF_PREFIX, default=DEFAULT_PREFIX): str,
+    }
+)
+
+STEP_REAUTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ACCESS_KEY_ID): str,
+        vol.Required(CONF_SECRET_ACCESS_KEY): str,
+    }
+)
+
+
+def normalize_prefix(prefix: str) -> str:
+    """Normalize a key prefix to "path/", or "" for the bucket root."""
+    prefix = prefix.strip().strip("/")
+    return f"{prefix}/" if prefix else ""
+
 
 class S3StorageConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for S3-compatible storage."""
@@ -32,19 +58,18 @@ class S3StorageConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         try:
-            session = boto3.Session(
+            session = aioboto3.Session(
                 aws_access_key_id=config[CONF_ACCESS_KEY_ID],
                 aws_secret_access_key=config[CONF_SECRET_ACCESS_KEY],
             )
 
-            s3_client = session.client(
+            async with session.client(
                 "s3",
                 endpoint_url=config.get(CONF_ENDPOINT_URL),
                 region_name=config.get(CONF_REGION),
-            )
-
-            # Test if we can access the bucket
-            s3_client.head_bucket(Bucket=config[CONF_BUCKET_NAME])
+            ) as s3_client:
+                # Test if we can access the bucket
+                await s3_client.head_bucket(Bucket=config[CONF_BUCKET_NAME])
 
         except ClientError as err:
             error_code = err.response.get("Error", {}).get("Code", "")
@@ -70,12 +95,19 @@ class S3StorageConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            self._async_abort_entries_match(
-                {
-                    CONF_ACCESS_KEY_ID: user_input[CONF_ACCESS_KEY_ID],
-                    CONF_BUCKET_NAME: user_input[CONF_BUCKET_NAME],
-                }
-            )
+            user_input = {
+                **user_input,
+                CONF_PREFIX: normalize_prefix(user_input.get(CONF_PREFIX, "")),
+            }
+            # Entries created before the prefix option have no prefix and
+            # use the bucket root
+            for entry in self._async_current_entries(include_ignore=False):
+                if (
+                    entry.data[CONF_ACCESS_KEY_ID] == user_input[CONF_ACCESS_KEY_ID]
+                    and entry.data[CONF_BUCKET_NAME] == user_input[CONF_BUCKET_NAME]
+                    and entry.data.get(CONF_PREFIX, "") == user_input[CONF_PREFIX]
+                ):
+                    return self.async_abort(reason="already_configured")
 
             errors = await self.validate_config(user_input)
 
@@ -87,15 +119,7 @@ class S3StorageConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_ACCESS_KEY_ID): str,
-                    vol.Required(CONF_SECRET_ACCESS_KEY): str,
-                    vol.Required(CONF_BUCKET_NAME, default="home-assistant-backups"): str,
-                    vol.Optional(CONF_ENDPOINT_URL): str,
-                    vol.Optional(CONF_REGION): str,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -127,11 +151,6 @@ class S3StorageConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_ACCESS_KEY_ID): str,
-                    vol.Required(CONF_SECRET_ACCESS_KEY): str,
-                }
-            ),
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
             errors=errors,
         )
\ No newline at end of file